@@ -4,7 +4,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     person_id: str
 
@@ -12,7 +12,7 @@ class Person:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     session_id: str
     date: str
@@ -0,0 +1,106 @@
+""" Test the asyncio email client against a fake aiosmtplib.SMTP """
+
+import asyncio
+
+import pytest
+
+aiosmtplib = pytest.importorskip("aiosmtplib")
+
+from src.utilities.email_utilities.async_smtp_client import AsyncSMTPClient, send_emails_concurrently
+from src.utilities.email_utilities.smtp_client import EmailMessage, SMTPTransport
+
+
+class FakeAsyncSMTP:
+    """ Records each connection's calls, in place of aiosmtplib.SMTP """
+
+    connections: list["FakeAsyncSMTP"] = []
+    # Number of upcoming logins to reject
+    failed_logins = 0
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.is_connected = False
+        self.logged_in = False
+        self.sent: list = []
+        FakeAsyncSMTP.connections.append(self)
+
+    async def connect(self) -> None:
+        self.is_connected = True
+
+    async def login(self, user, password) -> None:
+        if FakeAsyncSMTP.failed_logins:
+            FakeAsyncSMTP.failed_logins -= 1
+            raise aiosmtplib.SMTPAuthenticationError(454, "temporary auth failure")
+        self.logged_in = True
+
+    async def send_message(self, message) -> None:
+        assert self.logged_in, "sent on an unauthenticated connection"
+        self.sent.append(message)
+
+    async def quit(self) -> None:
+        self.is_connected = False
+
+    def close(self) -> None:
+        self.is_connected = False
+
+
+@pytest.fixture(autouse=True)
+def fake_aiosmtplib(monkeypatch):
+    monkeypatch.setenv("ODYSSEY_EMAIL_ADDRESS", "odyssey@example.com")
+    monkeypatch.setenv("GOOGLE_SMTP_APP_PASS", "app-pass")
+    monkeypatch.setattr(aiosmtplib, "SMTP", FakeAsyncSMTP)
+    FakeAsyncSMTP.connections = []
+    FakeAsyncSMTP.failed_logins = 0
+    yield
+
+
+def _message() -> EmailMessage:
+    return EmailMessage(
+        destination_email_address="dancer@example.com",
+        subject="[Odyssey Management] Today's Attendance",
+        plain_text_body="plain",
+        html_body="<p>html</p>",
+        attachments=[],
+    )
+
+
+def test_sends_reuse_one_connection():
+    async def _run() -> list[bool]:
+        async with AsyncSMTPClient() as client:
+            return await client.send_emails([_message(), _message()])
+
+    assert asyncio.run(_run()) == [True, True]
+    (conn,) = FakeAsyncSMTP.connections
+    assert len(conn.sent) == 2
+    assert not conn.is_connected
+
+
+def test_transport_selects_tls_mode():
+    asyncio.run(AsyncSMTPClient(SMTPTransport.SMTPS_465)._connect())
+    asyncio.run(AsyncSMTPClient()._connect())
+
+    implicit, starttls = FakeAsyncSMTP.connections
+    assert (implicit.kwargs["port"], implicit.kwargs["use_tls"], implicit.kwargs["start_tls"]) == (465, True, False)
+    assert (starttls.kwargs["port"], starttls.kwargs["use_tls"], starttls.kwargs["start_tls"]) == (587, False, True)
+
+
+def test_failed_login_does_not_leave_connection_for_reuse():
+    FakeAsyncSMTP.failed_logins = 1
+
+    async def _run() -> list[bool]:
+        async with AsyncSMTPClient() as client:
+            first = await client.send_email(_message())
+            assert client._smtp is None
+            return [first, await client.send_email(_message())]
+
+    assert asyncio.run(_run()) == [False, True]
+    failed, retried = FakeAsyncSMTP.connections
+    assert not failed.is_connected
+    assert len(retried.sent) == 1
+
+
+def test_concurrent_batches_use_one_connection_each():
+    results = asyncio.run(send_emails_concurrently([[_message()], [_message(), _message()]]))
+
+    assert results == [[True], [True, True]]
+    assert sorted(len(conn.sent) for conn in FakeAsyncSMTP.connections) == [1, 2]
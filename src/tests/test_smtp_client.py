@@ -1,5 +1,470 @@
 """ Test the function of the email utility module"""
 
-#@pytest.fixture
-#def 
+import atexit
+import base64
+import email
+import email.policy
+import os
+import smtplib
+import socket
+import threading
+from pathlib import Path
 
+import pytest
+
+from src.utilities.email_utilities import smtp_client
+from src.utilities.email_utilities.smtp_client import (
+    EmailClient,
+    EmailMessage,
+    QueuedEmailClient,
+    SMTPClient,
+    SMTPConfig,
+    SMTPEmailException,
+    SMTPTransport,
+)
+
+
+class FakeSocket:
+    def __init__(self) -> None:
+        self.options: list[tuple[int, int, int]] = []
+
+    def setsockopt(self, level: int, option: int, value: int) -> None:
+        self.options.append((level, option, value))
+
+
+class FakeSMTP:
+    """ Records the SMTP commands issued on each connection, in place of smtplib.SMTP """
+
+    connections: list["FakeSMTP"] = []
+    # Hooks the tests set to make a command fail: callable(connection) -> None
+    on_connect = None
+    on_login = None
+    on_mail = None
+    on_data = None
+
+    def __init__(self, host: str, port: int, context=None) -> None:
+        self.host = host
+        self.port = port
+        self.commands: list[tuple] = []
+        self.closed = False
+        self.sock = FakeSocket()
+        FakeSMTP.connections.append(self)
+        if FakeSMTP.on_connect:
+            FakeSMTP.on_connect(self)
+
+    def ehlo(self):
+        return 250, b""
+
+    def starttls(self, context=None):
+        self.commands.append(("starttls",))
+        return 220, b""
+
+    def login(self, user, password):
+        if FakeSMTP.on_login:
+            FakeSMTP.on_login(self)
+        return 235, b""
+
+    def ehlo_or_helo_if_needed(self) -> None:
+        pass
+
+    def has_extn(self, name: str) -> bool:
+        return False
+
+    def noop(self):
+        self.commands.append(("noop",))
+        return 250, b""
+
+    def mail(self, sender, options=()):
+        if FakeSMTP.on_mail:
+            FakeSMTP.on_mail(self)
+        self.commands.append(("mail", sender))
+        return 250, b""
+
+    def rcpt(self, recipient):
+        self.commands.append(("rcpt", recipient))
+        return 250, b""
+
+    def data(self, payload: bytes):
+        self.commands.append(("data", payload))
+        if FakeSMTP.on_data:
+            FakeSMTP.on_data(self)
+        return 250, b""
+
+    def rset(self):
+        return 250, b""
+
+    def quit(self):
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def sent(self, command: str) -> list[tuple]:
+        return [c for c in self.commands if c[0] == command]
+
+
+class FakeSMTPSSL(FakeSMTP):
+    pass
+
+
+def _all_sent(command: str) -> list[tuple]:
+    return [c for conn in FakeSMTP.connections for c in conn.sent(command)]
+
+
+@pytest.fixture(autouse=True)
+def fake_smtp(monkeypatch):
+    monkeypatch.setenv("ODYSSEY_EMAIL_ADDRESS", "odyssey@example.com")
+    monkeypatch.setenv("GOOGLE_SMTP_APP_PASS", "app-pass")
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(smtplib, "SMTP_SSL", FakeSMTPSSL)
+    monkeypatch.setattr(SMTPClient, "RETRY_BACKOFF", 0)
+    FakeSMTP.connections = []
+    FakeSMTP.on_connect = FakeSMTP.on_login = FakeSMTP.on_mail = FakeSMTP.on_data = None
+    yield
+
+
+@pytest.fixture
+def attachment(tmp_path) -> Path:
+    path = tmp_path / "attendance.bin"
+    path.write_bytes(os.urandom(5000))
+    return path
+
+
+def _message(to: str = "dancer@example.com", attachments: list[Path] | None = None, **kwargs) -> EmailMessage:
+    fields = {
+        "subject": "[Odyssey Management] Today's Attendance",
+        "plain_text_body": "plain",
+        "html_body": "<p>html</p>",
+    }
+    return EmailMessage(
+        destination_email_address=to,
+        attachments=attachments or [],
+        **(fields | kwargs),
+    )
+
+
+# Connection reuse
+
+def test_sends_reuse_one_connection_without_noop():
+    client = SMTPClient()
+    assert client.send_emails([_message(), _message(), _message()]) == [True, True, True]
+
+    assert len(FakeSMTP.connections) == 1
+    assert len(_all_sent("data")) == 3
+    assert _all_sent("noop") == []
+
+
+def test_idle_connection_is_health_checked(monkeypatch):
+    monkeypatch.setattr(SMTPClient, "IDLE_CHECK_AFTER", -1)
+    client = SMTPClient()
+    client.send_email(_message())
+    client.send_email(_message())
+
+    assert len(FakeSMTP.connections) == 1
+    assert len(_all_sent("noop")) == 1
+
+
+def test_email_client_context_manager_closes_connection():
+    with EmailClient() as client:
+        client.send_email(_message())
+    assert FakeSMTP.connections[0].closed
+
+
+# Batch send
+
+def test_connection_rotates_at_max_per_connection(monkeypatch):
+    monkeypatch.setattr(SMTPClient, "MAX_PER_CONNECTION", 2)
+    client = SMTPClient()
+    assert all(client.send_emails([_message() for _ in range(5)]))
+
+    assert [len(conn.sent("data")) for conn in FakeSMTP.connections] == [2, 2, 1]
+    assert all(conn.closed for conn in FakeSMTP.connections[:-1])
+
+
+# Thread-pool fan-out
+
+def test_send_many_uses_one_connection_per_worker():
+    results = EmailClient().send_many([_message() for _ in range(8)], max_workers=3)
+
+    assert results == [True] * 8
+    # EmailClient's own client stays unconnected, each worker thread opens one connection
+    assert 1 <= len(FakeSMTP.connections) <= 3
+    assert sum(len(conn.sent("data")) for conn in FakeSMTP.connections) == 8
+    assert all(conn.closed for conn in FakeSMTP.connections)
+
+
+def test_send_many_closes_worker_connections_on_error():
+    with pytest.raises(SMTPEmailException):
+        EmailClient().send_many([_message(), None, _message()], max_workers=2)
+
+    assert FakeSMTP.connections
+    assert all(conn.closed for conn in FakeSMTP.connections)
+
+
+# Attachment encoding
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 56, 57, 58, 57 * 1024, 57 * 1024 + 5, 300_000])
+def test_base64_stream_matches_stdlib(tmp_path, size):
+    path = tmp_path / "data.bin"
+    data = os.urandom(size)
+    path.write_bytes(data)
+
+    with open(path, "rb") as fh:
+        encoded = smtp_client._encode_base64_stream(fh, size)
+
+    assert encoded == base64.encodebytes(data).decode("ascii")
+    assert base64.b64decode(encoded) == data
+
+
+# Transport
+
+def test_transport_selects_port_and_handshake():
+    SMTPClient(SMTPTransport.SMTPS_465).send_email(_message())
+    SMTPClient().send_email(_message())
+
+    implicit, starttls = FakeSMTP.connections
+    assert (type(implicit), implicit.port, implicit.sent("starttls")) == (FakeSMTPSSL, 465, [])
+    assert (type(starttls), starttls.port, len(starttls.sent("starttls"))) == (FakeSMTP, 587, 1)
+    assert SMTPConfig("a", "b", smtp_port=2525).smtp_port == 2525
+
+
+# Broadcast
+
+def test_broadcast_splices_to_header_per_recipient(attachment):
+    recipients = ["a@example.com", "b@example.com"]
+    assert SMTPClient().broadcast(recipients, _message(to="", attachments=[attachment])) == [True, True]
+
+    payloads = [c[1] for c in _all_sent("data")]
+    assert [c[1] for c in _all_sent("rcpt")] == recipients
+    for recipient, payload in zip(recipients, payloads):
+        parsed = email.message_from_bytes(payload, policy=email.policy.default)
+        assert parsed.get_all("To") == [recipient]
+        (part,) = parsed.iter_attachments()
+        assert part.get_content() == attachment.read_bytes()
+
+    # Everything after the To: header is the same cached body
+    assert payloads[0].split(b"\r\n", 1)[1] == payloads[1].split(b"\r\n", 1)[1]
+
+
+def test_broadcast_encodes_non_ascii_display_name():
+    recipient = "Jöhn Døe <john@example.com>"
+    assert SMTPClient().broadcast([recipient], _message(to="")) == [True]
+
+    (_, payload), = _all_sent("data")
+    parsed = email.message_from_bytes(payload, policy=email.policy.default)
+    assert parsed["To"] == recipient
+
+
+def test_broadcast_rejects_header_injection_and_continues():
+    recipients = ["a@example.com\r\nBcc: evil@example.com", "b@example.com"]
+    assert SMTPClient().broadcast(recipients, _message(to="")) == [False, True]
+
+    assert [c[1] for c in _all_sent("rcpt")] == ["b@example.com"]
+    (_, payload), = _all_sent("data")
+    assert b"evil@example.com" not in payload
+
+
+# Attachment validation
+
+def test_missing_attachment_raises(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Could not find file"):
+        SMTPClient()._build_email_message(_message(attachments=[tmp_path / "missing.bin"]))
+
+
+# Recipients
+
+def test_multiple_recipients_share_one_transaction():
+    message = _message(destination_email_addresses=["a@example.com", "b@example.com"])
+    assert SMTPClient().send_email(message)
+
+    (conn,) = FakeSMTP.connections
+    assert len(conn.sent("mail")) == 1
+    assert [c[1] for c in conn.sent("rcpt")] == ["dancer@example.com", "a@example.com", "b@example.com"]
+    (_, payload), = conn.sent("data")
+    assert email.message_from_bytes(payload)["To"] == "dancer@example.com, a@example.com, b@example.com"
+
+
+def test_message_without_recipients_is_rejected_before_connecting():
+    with pytest.raises(SMTPEmailException, match="recipient"):
+        SMTPClient().send_email(_message(to="", destination_email_addresses=["", ""]))
+    assert FakeSMTP.connections == []
+
+
+# Queued client
+
+def test_queued_client_sends_and_rejects_after_close():
+    client = QueuedEmailClient()
+    client.send_email(_message())
+    client.flush()
+    client.close()
+    client.close()
+
+    assert len(_all_sent("data")) == 1
+    with pytest.raises(SMTPEmailException):
+        client.send_email(_message())
+    client.flush()
+
+
+def test_queued_client_close_sends_everything_still_queued():
+    gate = threading.Event()
+    FakeSMTP.on_connect = lambda conn: gate.wait()
+
+    client = QueuedEmailClient()
+    for _ in range(3):
+        client.send_email(_message())
+    gate.set()
+    client.close()
+
+    assert len(_all_sent("data")) == 3
+    assert not client._worker.is_alive()
+
+
+def test_queued_client_closes_at_exit(monkeypatch):
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(atexit, "unregister", registered.remove)
+
+    client = QueuedEmailClient()
+    assert registered == [client.close]
+    client.close()
+    assert registered == []
+
+
+# Credentials
+
+def test_missing_credentials_fail_before_connecting(monkeypatch):
+    monkeypatch.setenv("GOOGLE_SMTP_APP_PASS", "")
+    with pytest.raises(ValueError):
+        SMTPClient()
+    assert FakeSMTP.connections == []
+
+
+# Attachment cache
+
+def test_attachment_encoded_once_until_modified(monkeypatch, attachment):
+    monkeypatch.setattr(smtp_client, "_ENCODED_ATTACHMENTS", smtp_client._EncodedAttachmentCache(1 << 20))
+    encodes = []
+    original = smtp_client._encode_base64_stream
+    monkeypatch.setattr(
+        smtp_client, "_encode_base64_stream", lambda fh, size: encodes.append(size) or original(fh, size)
+    )
+
+    client = SMTPClient()
+    for _ in range(3):
+        client._build_email_message(_message(attachments=[attachment]))
+    assert len(encodes) == 1
+
+    attachment.write_bytes(os.urandom(6000))
+    message = client._build_email_message(_message(attachments=[attachment]))
+    assert len(encodes) == 2
+    (part,) = message.iter_attachments()
+    assert part.get_content() == attachment.read_bytes()
+
+
+def test_attachment_cache_is_bounded_by_bytes(tmp_path):
+    cache = smtp_client._EncodedAttachmentCache(max_bytes=1000)
+    for index, size in enumerate([300, 300, 300, 2000]):
+        path = tmp_path / f"file{index}.bin"
+        path.write_bytes(os.urandom(size))
+        with open(path, "rb") as fh:
+            cache.get_or_encode(fh)
+
+    # Third 300 byte payload (408 chars each) evicts the first, the 2000 byte one is never cached
+    assert len(cache._entries) == 2
+    assert cache._size <= 1000
+
+
+# Socket options
+
+def test_socket_disables_nagle_and_enlarges_send_buffer():
+    SMTPClient().send_email(_message())
+
+    options = FakeSMTP.connections[0].sock.options
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+    assert (socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20) in options
+
+
+# Retry / give up
+
+def test_reconnects_after_disconnect_before_data():
+    client = SMTPClient()
+    client.send_email(_message())
+
+    def drop_first_connection(conn):
+        if conn is FakeSMTP.connections[0]:
+            raise smtplib.SMTPServerDisconnected("idle timeout")
+
+    FakeSMTP.on_mail = drop_first_connection
+    assert client.send_email(_message())
+
+    assert len(FakeSMTP.connections) == 2
+    assert len(_all_sent("data")) == 2
+
+
+def test_gives_up_after_max_attempts():
+    def refuse(conn):
+        raise smtplib.SMTPConnectError(421, b"busy")
+
+    FakeSMTP.on_connect = refuse
+    assert SMTPClient().send_email(_message()) is False
+    assert len(FakeSMTP.connections) == SMTPClient.MAX_ATTEMPTS
+
+
+def test_disconnect_after_data_is_not_resent():
+    def drop(conn):
+        raise smtplib.SMTPServerDisconnected("lost final reply")
+
+    FakeSMTP.on_data = drop
+    assert SMTPClient().send_email(_message()) is False
+    assert len(_all_sent("data")) == 1
+
+
+def test_auth_failure_closes_half_open_connection():
+    def reject(conn):
+        raise smtplib.SMTPAuthenticationError(535, b"bad credentials")
+
+    FakeSMTP.on_login = reject
+    client = SMTPClient()
+    assert client.send_email(_message()) is False
+
+    assert len(FakeSMTP.connections) == 1
+    assert FakeSMTP.connections[0].closed
+    assert client._smtp is None
+
+
+def test_batch_aborts_after_a_third_fails():
+    def reject(conn):
+        raise smtplib.SMTPAuthenticationError(535, b"bad credentials")
+
+    FakeSMTP.on_login = reject
+    results = SMTPClient().send_emails([_message() for _ in range(6)])
+
+    assert results == [False] * 6
+    assert len(FakeSMTP.connections) == 3
+
+
+def test_batch_does_not_abort_on_refused_recipients():
+    attempts = []
+
+    def refuse_recipients(conn):
+        attempts.append(conn)
+        if len(attempts) <= 4:
+            raise smtplib.SMTPRecipientsRefused({"dancer@example.com": (550, b"no such user")})
+
+    FakeSMTP.on_mail = refuse_recipients
+    results = SMTPClient().send_emails([_message() for _ in range(6)])
+
+    assert results == [False] * 4 + [True] * 2
+    assert len(_all_sent("data")) == 2
+
+
+def test_batch_needs_min_attempts_before_aborting():
+    def reject(conn):
+        raise smtplib.SMTPAuthenticationError(535, b"bad credentials")
+
+    FakeSMTP.on_login = reject
+    results = SMTPClient().send_emails([_message(), _message()])
+
+    # 2 failures are over a third of the batch, but both messages are still tried
+    assert results == [False, False]
+    assert len(FakeSMTP.connections) == 2
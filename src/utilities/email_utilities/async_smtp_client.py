@@ -0,0 +1,142 @@
+"""
+Asyncio counterpart of the SMTPClient using aiosmtplib. The SMTP round-trips
+are awaited on the event loop instead of blocking the caller, so other
+coroutines run during the network wait. Sends on one client are still
+sequential; concurrency comes from several clients (send_emails_concurrently()).
+
+Same Gmail SMTP server, credentials and MIME layout as smtp_client.py
+
+"""
+
+import asyncio
+import logging
+
+import aiosmtplib
+
+from src.utilities.email_utilities.smtp_client import (
+    SECURITY_CONTRACT,
+    EmailMessage,
+    SMTPClientBase,
+    SMTPEmailException,
+    SMTPTransport,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSMTPClient(SMTPClientBase):
+    """
+    SMTP Client from aiosmtplib. One persistent TLS connection per instance.
+
+    SMTP is sequential per connection, use several instances (see
+    send_emails_concurrently()) to send in parallel.
+
+    Exposes: send_email(), send_emails() coroutines, see related docstrings.
+
+    """
+
+    def __init__(self, security_contract: SMTPTransport = SECURITY_CONTRACT) -> None:
+        super().__init__(security_contract)
+        self._smtp: aiosmtplib.SMTP | None = None
+
+    async def __aenter__(self) -> "AsyncSMTPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _connect(self) -> None:
+        """ Open the TLS connection to the SMTP Server and authenticate once. """
+        implicit_tls = self._cfg.security_contract is SMTPTransport.SMTPS_465
+        self._smtp = aiosmtplib.SMTP(
+            hostname=self._cfg.smtp_server,
+            port=self._cfg.smtp_port,
+            use_tls=implicit_tls,
+            start_tls=not implicit_tls,
+            tls_context=self._SSL_CONTEXT,
+        )
+        try:
+            await self._smtp.connect()
+            await self._smtp.login(self._cfg.sender_email_address, self._cfg.google_smtp_app_passwd)
+        except Exception:
+            # Never keep a half-open (e.g. unauthenticated) connection around
+            await self.close()
+            raise
+
+    async def _ensure_connected(self) -> None:
+        """ Reuse the open connection, otherwise (re)connect. """
+        if self._smtp is None or not self._smtp.is_connected:
+            await self._connect()
+
+    async def send_email(self, email_contents: EmailMessage) -> bool:
+        """
+        Create a MIME Email with plain text and html versions and send it
+        over the shared connection without blocking the event loop.
+
+        """
+        if not email_contents:
+            raise SMTPEmailException("Must Specify Message Contents for Mail Transfer")
+
+        email = self._build_email_message(email_contents)
+        try:
+            await self._ensure_connected()
+            await self._smtp.send_message(email)
+            return True
+
+        except aiosmtplib.SMTPConnectError:
+            logger.exception("Error Connecting to server.")
+            return False
+        except aiosmtplib.SMTPAuthenticationError:
+            logger.exception("Error with Server Auth.")
+            return False
+        except aiosmtplib.SMTPSenderRefused:
+            logger.exception("Sender Email Address Refused to comply.")
+            return False
+        except aiosmtplib.SMTPException:
+            logger.exception("Error with SMTP Operation.")
+            return False
+        except Exception:
+            logger.exception("Exception raised in AsyncSMTPClient.send_email() instance.")
+            return False
+
+    async def send_emails(self, messages: list[EmailMessage]) -> list[bool]:
+        """ Send a batch of emails in order over the shared connection """
+        return [await self.send_email(email_contents) for email_contents in messages]
+
+    async def close(self) -> None:
+        """ QUIT the open connection. Safe to call when already closed. """
+        if self._smtp is None:
+            return
+        try:
+            if self._smtp.is_connected:
+                await self._smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):  # Already dropped, just release the socket
+            self._smtp.close()
+        finally:
+            self._smtp = None
+
+
+async def send_emails_concurrently(
+        batches: list[list[EmailMessage]],
+        security_contract: SMTPTransport = SECURITY_CONTRACT,
+    ) -> list[list[bool]]:
+    """
+    Fan out each batch onto its own AsyncSMTPClient connection and send
+    them concurrently. Results are returned per batch, in order.
+
+    """
+    async def _send_batch(messages: list[EmailMessage]) -> list[bool]:
+        async with AsyncSMTPClient(security_contract) as client:
+            return await client.send_emails(messages)
+
+    return list(await asyncio.gather(*(_send_batch(batch) for batch in batches)))
+
+
+def send_email_sync(email_contents: EmailMessage, security_contract: SMTPTransport = SECURITY_CONTRACT) -> bool:
+    """ Entry point for synchronous callers, runs a single send on a new event loop """
+    async def _send() -> bool:
+        async with AsyncSMTPClient(security_contract) as client:
+            return await client.send_email(email_contents)
+
+    return asyncio.run(_send())
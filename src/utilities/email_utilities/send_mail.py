@@ -15,27 +15,28 @@ def main() -> None:
         "odysseydancetroupe@helleniccommunity.com"
         ]
 
-    for email_addr in recipients:
-        mail_template: EmailMessage = EmailMessage(
+    mail_templates: list[EmailMessage] = [
+        EmailMessage(
             destination_email_address=email_addr,
             subject="[Odyssey Management] Today's Attendance",
             plain_text_body="Fall Back to Text [ERROR]",
             html_body=HTMLEmailTemplate.ATTENDANCE_AUTOMATED_SEND_HTML,
             attachments=[ATTACHMENT_PATH],
         )
-
-        try:
-            email_client = EmailClient()
-
-            print(f"Sending Email to {email_addr}...")
-            if not email_client.send_email(mail_template):
-                print(f"Email to {email_addr} FAIL")
-            else:
-                print(f"Email to {email_addr} PASS")
-        except SMTPEmailException as e:
-            print(f"Error with Email Transfer {type(e)}: {e}")
-        except Exception as e:
-            print(f"Error with Email Transfer {type(e)}: {e}")
+        for email_addr in recipients
+    ]
+
+    try:
+        with EmailClient() as email_client:
+            print(f"Sending {len(mail_templates)} Emails...")
+            results = email_client.send_emails(mail_templates)
+
+        for email_addr, sent in zip(recipients, results):
+            print(f"Email to {email_addr} {'PASS' if sent else 'FAIL'}")
+    except SMTPEmailException as e:
+        print(f"Error with Email Transfer {type(e)}: {e}")
+    except Exception as e:
+        print(f"Error with Email Transfer {type(e)}: {e}")
 
 
 
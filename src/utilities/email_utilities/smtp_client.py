@@ -1,33 +1,64 @@
 """
 Module using the built-in smtp and email libraries to send automated
 emails over gmail smtp. Using Google Mail as a smtp server with
-pre-authorized credentials. Encryption via SSL
+pre-authorized credentials. Encryption via STARTTLS (or implicit SSL)
 
 
 """
 
+import atexit
+import base64
+import logging
 import os
+import queue
 import smtplib
+import socket
 import ssl
+import threading
+import time
 
+from collections import OrderedDict
 from pathlib import Path
 from enum import StrEnum
+from typing import BinaryIO, ClassVar
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 
 import mimetypes
-from email import encoders
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage as MIMEEmailMessage, MIMEPart
+from email.policy import SMTP
 
 
-class SMTPServerConfig(StrEnum):
-    SMTP_SERVER= "smtp.gmail.com"
-    SMTP_PORT= "465"
-    SECURITY_CONTRACT = "SSL"  # Secure Sockets Layer
+logger = logging.getLogger(__name__)
 
+# Connection level failures worth retrying on a fresh connection
+_TRANSIENT_SMTP_ERRORS = (smtplib.SMTPConnectError, smtplib.SMTPServerDisconnected, ConnectionError)
 
-@dataclass(frozen=True)
+# 57 raw bytes encode to one 76 char base64 line, read whole lines per chunk
+_BASE64_CHUNK_SIZE: int = 57 * 1024
+_ATTACHMENT_READ_BUFFER: int = 64 * 1024
+_ATTACHMENT_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+_SOCKET_SEND_BUFFER: int = 1 << 20
+
+
+class SMTPTransport(StrEnum):
+    STARTTLS_587 = "STARTTLS"  # Plain connect on submission port, upgraded via STARTTLS
+    SMTPS_465 = "SSL"  # Implicit TLS (Secure Sockets Layer) from the first byte
+
+    @property
+    def default_port(self) -> int:
+        """ The port this transport's handshake is served on """
+        return SMTPS_PORT if self is SMTPTransport.SMTPS_465 else SMTP_PORT
+
+
+# Server defaults, plain typed constants so nothing is re-parsed per connection
+SMTP_SERVER: str = "smtp.gmail.com"
+SMTP_PORT: int = 587  # STARTTLS submission port
+SMTPS_PORT: int = 465  # Implicit TLS port
+SECURITY_CONTRACT: SMTPTransport = SMTPTransport.STARTTLS_587
+
+
+@dataclass(frozen=True, slots=True)
 class EmailMessage:
     """ Dictate the Contents of an email to send. Html injected via stdlib string """
     destination_email_address: str
@@ -35,6 +66,15 @@ class EmailMessage:
     plain_text_body: str
     html_body: str
     attachments: list[Path]
+    # Extra To: recipients, delivered in the same SMTP transaction (one MAIL FROM, many RCPT TO)
+    destination_email_addresses: list[str] = field(default_factory=list)
+
+    @property
+    def recipients(self) -> list[str]:
+        """ Every To: address of the message, primary destination first """
+        return [
+            addr for addr in (self.destination_email_address, *self.destination_email_addresses) if addr
+        ]
 
 
 class SMTPEmailException(Exception):
@@ -49,87 +89,186 @@ class MIMESemantics(StrEnum):
     PLAIN_TEXT = "plain"
     HTML = "html"
     MIXED = "mixed"
+    CONTENT_TYPE = "Content-Type"
+    CONTENT_TRANSFER_ENCODING = "Content-Transfer-Encoding"
+    CONTENT_DISPOSITION = "Content-Disposition"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SMTPConfig:
     sender_email_address: str
     google_smtp_app_passwd: str
-    smtp_server: str = field(default=SMTPServerConfig.SMTP_SERVER)
-    smtp_port: str = field(default=SMTPServerConfig.SMTP_PORT)
-    security_contract: str = field(default=SMTPServerConfig.SECURITY_CONTRACT)
+    smtp_server: str = field(default=SMTP_SERVER)
+    # None picks the port matching security_contract
+    smtp_port: int | None = field(default=None)
+    security_contract: SMTPTransport = field(default=SECURITY_CONTRACT)
 
+    def __post_init__(self) -> None:
+        if self.smtp_port is None:
+            object.__setattr__(self, "smtp_port", self.security_contract.default_port)
 
-class SMTPClient:
+
+def _encode_base64_stream(fh: BinaryIO, size: int) -> str:
     """
-    SMTP Client from smtplib. Using MIME (Multipart International Mail Extensions)
-    Composed of SMTPConfig and related defaults.
+    Base64 encode an open file chunk by chunk into MIME lines (RFC 2045).
+    Reads in multiples of 57 bytes so every output line is exactly 76 chars
+    and no chunk boundary splits a line. The output buffer is sized up front
+    from the file size, so it is never reallocated while encoding.
+
+    :param fh: File opened in binary mode
+    :param size: st_size of the file, from fstat() on the open handle
+    """
+    # 4 chars per 3 bytes, plus one newline per 57 byte input line
+    out = bytearray(-(-size // 3) * 4 + -(-size // 57))
+    pos = 0
+    while chunk := fh.read(_BASE64_CHUNK_SIZE):
+        encoded = base64.encodebytes(chunk)
+        out[pos:pos + len(encoded)] = encoded
+        pos += len(encoded)
+    del out[pos:]  # File shrank since fstat()
+    return out.decode("ascii")
+
+
+class _EncodedAttachmentCache:
+    """
+    LRU cache of base64 attachment payloads, bounded by their total size
+    rather than entry count, so the same file sent in many emails is read
+    and encoded once without pinning unbounded memory. Payloads larger than
+    the whole budget are encoded but never cached.
 
-    Also handles the email structure via MIMEMultipart. Fallback to plain text.
+    Keyed by (device, inode, mtime, size) from fstat() on the open handle, a
+    modified file misses the cache and is encoded again.
 
-    Exposes: send_email() public method, see related docstring.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes: int = max_bytes
+        self._size: int = 0
+        self._entries: OrderedDict[tuple[int, int, int, int], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_encode(self, fh: BinaryIO) -> str:
+        """ Cached payload for the open file, encoding it on a miss """
+        st = os.fstat(fh.fileno())
+        key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                return payload
+
+        payload = _encode_base64_stream(fh, st.st_size)
+        if len(payload) > self._max_bytes:
+            return payload
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = payload
+                self._size += len(payload)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+        return payload
+
+
+_ENCODED_ATTACHMENTS = _EncodedAttachmentCache(_ATTACHMENT_CACHE_MAX_BYTES)
+
+
+class SMTPClientBase:
+    """
+    Shared configuration and MIME construction for the SMTP clients.
+    Composed of SMTPConfig and related defaults.
+
+    Handles the email structure via email.message.EmailMessage. Fallback to plain text.
+    Transport (sync or async) is left to the subclasses.
 
     """
     # The service account for the Odyssey Management Software, stored via ENV VARS
     _SENDER_EMAIL_ADDRESS: str = "ODYSSEY_EMAIL_ADDRESS"
     _GOOGLE_SMTP_APP_PASS: str = "GOOGLE_SMTP_APP_PASS"
 
-    def __init__(self) -> None:
+    # Loading the CA bundle is expensive, build one context per process and share it.
+    _SSL_CONTEXT: ClassVar[ssl.SSLContext] = ssl.create_default_context()
+
+    def __init__(self, security_contract: SMTPTransport = SECURITY_CONTRACT) -> None:
+        sender_email_address = os.getenv(self._SENDER_EMAIL_ADDRESS)
+        google_smtp_app_passwd = os.getenv(self._GOOGLE_SMTP_APP_PASS)
+        # Fail fast, before any TLS handshake is spent on a login that cannot succeed
+        self._check_env_vars(sender_email_address, google_smtp_app_passwd)
+
         self._cfg: SMTPConfig = SMTPConfig(
-            sender_email_address=os.getenv(self._SENDER_EMAIL_ADDRESS, ""),
-            google_smtp_app_passwd=os.getenv(self._GOOGLE_SMTP_APP_PASS, ""),
+            sender_email_address=sender_email_address,
+            google_smtp_app_passwd=google_smtp_app_passwd,
+            security_contract=security_contract,
         )
-        self._check_env_vars()
-    
-    def _check_env_vars(self) -> None:
-        if self._cfg.sender_email_address is None:
-            raise ValueError(f"SMTPClient: Could Not Find sender_email_address; {self._cfg.sender_email_address}")
+
+    @staticmethod
+    def _check_env_vars(sender_email_address: str | None, google_smtp_app_passwd: str | None) -> None:
+        if not sender_email_address:
+            raise ValueError("SMTPClient: Could Not Find sender_email_address")
         
-        if self._cfg.google_smtp_app_passwd is None:
+        if not google_smtp_app_passwd:
             raise ValueError("SMTPClient: Could Not find Google SMTP Server Passwd")
 
+    @staticmethod
+    def _add_attachments(msg: MIMEEmailMessage, files: list[Path]) -> None:
+        """
+        Add attachments to the given (per-send) message.
+        Encode the file into ASCII Chars.
+
+        Raises FileNotFoundError.
+
+        :param: List of file Path objects
+        """
+        for file in files:
+            ctype, encoding = mimetypes.guess_type(str(file))
+            if ctype is None or encoding is not None:
+                ctype = "application/octet-stream"
+
+            # Open directly instead of exists() + open(), one syscall and no race
+            try:
+                fh = open(file, "rb", buffering=_ATTACHMENT_READ_BUFFER)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Could not find file: {file}") from None
+
+            maintype, subtype = ctype.split("/", 1)
+            with fh:
+                if maintype == "text":
+                    msg.add_attachment(
+                        fh.read().decode("utf-8", errors="replace"),
+                        subtype=subtype,
+                        filename=file.name,
+                    )
+                    continue
+
+                # Pre-encoded part, skips the content manager's full-buffer base64 pass
+                part = MIMEPart(policy=SMTP)
+                part[MIMESemantics.CONTENT_TYPE] = ctype
+                part[MIMESemantics.CONTENT_TRANSFER_ENCODING] = "base64"
+                part.add_header(MIMESemantics.CONTENT_DISPOSITION, "attachment", filename=file.name)
+                part.set_payload(_ENCODED_ATTACHMENTS.get_or_encode(fh))
+
+            if msg.get_content_subtype() != MIMESemantics.MIXED:
+                msg.make_mixed()
+            msg.attach(part)
+
     def _build_email_message(
             self,
             email_contents: EmailMessage,
-        ) -> MIMEMultipart:
+        ) -> MIMEEmailMessage:
         """
         Create an email with a plain text and HTML semantics. The HTML Version
           always be attempted first, with the plain text as a fallback.
 
-        :param email_contents: The EmailMessage dataclass
-        """
-
-        def _add_attachments(msg: MIMEBase, files: list[Path]) -> None:
-            """
-            Add attachments to the instance's message.
-            Encode the file into ASCII Chars.
-
-            Raises FileNotFoundError.
+        Built on the email.message.EmailMessage API with the SMTP policy, so
+        it serializes straight to wire-ready CRLF bytes with as_bytes().
 
-            :param: List of file Path objects
-            """
-            for file in files:
-                if not file.exists():
-                    raise FileNotFoundError(f"Could not find file: {file}")
-
-                ctype, encoding = mimetypes.guess_type(str(file))
-                if ctype is None or encoding is not None:
-                    ctype = "application/octet-stream"
-
-                maintype, subtype = ctype.split("/", 1)
-                with open(file, "rb") as f:
-                    data = f.read()
-
-                if maintype == "text":
-                    part = MIMEText(data.decode("utf-8", errors="replace"), _subtype=subtype)
-                else:
-                    part = MIMEBase(maintype, subtype)
-                    part.set_payload(data)
-                    encoders.encode_base64(part)
-
-                part.add_header("Content-Disposition", f'attachment; filename="{file.name}"')
-                msg.attach(part)
+        A new message is built on every call and never stored on the instance,
+        so sends do not leak headers/attachments into each other and are safe
+        to run from several threads.
 
+        :param email_contents: The EmailMessage dataclass
+        """
         if not email_contents.plain_text_body:
             raise RuntimeError("Must Specify a plain text alternative to Email Contents")
 
@@ -139,63 +278,316 @@ class SMTPClient:
         if not email_contents.subject:
             raise RuntimeError("Must Specify subject in Email Contents")
 
-        message = MIMEMultipart(MIMESemantics.MIXED)
+        message = MIMEEmailMessage(policy=SMTP)
         message[MIMESemantics.SUBJECT] = email_contents.subject
         message[MIMESemantics.FROM] = self._cfg.sender_email_address
-        message[MIMESemantics.TO] = email_contents.destination_email_address
+        message[MIMESemantics.TO] = ", ".join(email_contents.recipients)
 
         # Adding the html alternative last, server will render last one first.
-        alt = MIMEMultipart("alternative")
-        alt.attach(MIMEText(email_contents.plain_text_body, MIMESemantics.PLAIN_TEXT))
-        alt.attach(MIMEText(email_contents.html_body, MIMESemantics.HTML))
-        message.attach(alt)
+        message.set_content(email_contents.plain_text_body, subtype=MIMESemantics.PLAIN_TEXT)
+        message.add_alternative(email_contents.html_body, subtype=MIMESemantics.HTML)
 
-        _add_attachments(message, email_contents.attachments)
+        self._add_attachments(message, email_contents.attachments)
 
         return message
 
 
+class SMTPClient(SMTPClientBase):
+    """
+    SMTP Client from smtplib. Using MIME (Multipart International Mail Extensions)
+    over a persistent TLS connection.
+
+    Exposes: send_email() public method, see related docstring.
+
+    """
+    # Rotate the connection after this many messages to stay under provider caps
+    MAX_PER_CONNECTION: int = 1000
+
+    # Only NOOP-check a connection idle for longer than this many seconds, a
+    # stale connection in between is caught by the MAIL FROM retry instead
+    IDLE_CHECK_AFTER: float = 30.0
+
+    # Retry transient connection failures before DATA, sleeping RETRY_BACKOFF * 2**attempt seconds
+    MAX_ATTEMPTS: int = 3
+    RETRY_BACKOFF: float = 0.5
+
+    # Abort send_emails() once more than this share of the batch hit connection
+    # or auth failures, but never before MIN_BATCH_ATTEMPTS messages were tried
+    MAX_BATCH_FAILURE_RATIO: float = 1 / 3
+    MIN_BATCH_ATTEMPTS: int = 3
+
+    def __init__(self, security_contract: SMTPTransport = SECURITY_CONTRACT) -> None:
+        super().__init__(security_contract)
+        # Persistent connection, lazily opened and reused across sends
+        self._smtp: smtplib.SMTP | None = None
+        self._sent_on_connection: int = 0
+        self._last_used: float = 0.0
+        # Whether the last failed delivery was a connection/auth failure rather than a per-message refusal
+        self._connection_failed: bool = False
+
     def send_email(self, email_contents: EmailMessage) -> bool:
         """
         Create a MIME Email with plain text and html versions. 
-        Connect to an SMTP Server (In this case: Gmail SMTP) through SSL.
+        Connect to an SMTP Server (In this case: Gmail SMTP) through TLS.
+        All recipients of the message share a single mail transaction.
+        The connection is kept open and reused by later sends until close().
 
         Raises SMTP Connection, Authentication
 
         """
         if not email_contents:
             raise SMTPEmailException("Must Specify Message Contents for Mail Transfer")
+        if not email_contents.recipients:
+            raise SMTPEmailException("Must Specify at least one recipient for Mail Transfer")
 
-        email = self._build_email_message(email_contents)
+        # Serialize straight to CRLF bytes with the SMTP policy, sendmail() passes
+        # bytes through untouched instead of re-encoding a str copy of the message
+        payload = self._build_email_message(email_contents).as_bytes()
+        return self._deliver(self._cfg.sender_email_address, email_contents.recipients, payload)
+
+    def _deliver(self, sender: str, recipients: list[str], payload: bytes) -> bool:
+        """
+        Run a single mail transaction on the shared connection. Connection
+        failures up to and including RCPT TO are retried on a fresh connection
+        (see _open_transaction()). Once DATA is sent the message is never
+        resent, the server may already have accepted it. Errors are logged
+        and mapped to False.
+
+        :param sender: MAIL FROM address
+        :param recipients: One RCPT TO per address
+        :param payload: The serialized message
+        """
+        data_sent = False
+        self._connection_failed = False
         try:
-            with smtplib.SMTP_SSL(
-                    self._cfg.smtp_server,
-                    int(self._cfg.smtp_port),
-                    context=ssl.create_default_context()) as smtp_server:
-                smtp_server.login(self._cfg.sender_email_address, self._cfg.google_smtp_app_passwd)
-                smtp_server.send_message(email)
+            refused = self._open_transaction(sender, recipients, len(payload))
+            data_sent = True
+            code, resp = self._smtp.data(payload)
+            if code != 250:
+                self._smtp.rset()
+                raise smtplib.SMTPDataError(code, resp)
+            self._sent_on_connection += 1
+            self._last_used = time.monotonic()
+
+            # Only raised if every recipient was refused, report partial refusals
+            if refused:
+                logger.warning("Some recipients were refused by the server: %s", refused)
             return True
 
-        # TODO: Get all of these in the logger when complete
-        except smtplib.SMTPConnectError as e:
-            print(f"Error Connecting to server. {type(e)}: {e}")
+        except _TRANSIENT_SMTP_ERRORS:
+            self._connection_failed = True
+            self.close()
+            if data_sent:
+                logger.exception("Connection lost after DATA, not resending in case the server accepted it.")
+            else:
+                logger.exception("Giving up on SMTP delivery after %d attempts.", self.MAX_ATTEMPTS)
             return False
-        except smtplib.SMTPAuthenticationError as e:
-            print(f"Error with Server Auth. {type(e)}: {e}")
+        except smtplib.SMTPAuthenticationError:
+            self._connection_failed = True
+            logger.exception("Error with Server Auth.")
             return False
-        except smtplib.SMTPSenderRefused as e:
-            print(f"Sender Email Address Refused to comply. {type(e)}: {e}")
+        except smtplib.SMTPSenderRefused:
+            logger.exception("Sender Email Address Refused to comply.")
             return False
-        except smtplib.SMTPException as e:
-            print(f"Error with SMTP Operation. {type(e)}: {e}")
+        except smtplib.SMTPException:
+            logger.exception("Error with SMTP Operation.")
             return False
-        except Exception as e:
-            print(f"Exception raised in SMTPClient.send_email() instance. {e}")
+        except Exception:
+            logger.exception("Exception raised in SMTPClient.send_email() instance.")
             return False
 
+    def _open_transaction(self, sender: str, recipients: list[str], size: int) -> dict[str, tuple[int, bytes]]:
+        """
+        Connect if needed, then issue MAIL FROM and RCPT TO (the envelope half
+        of sendmail()). Nothing has been delivered at this point, so transient
+        connection failures are retried on a fresh connection, sleeping
+        RETRY_BACKOFF * 2**attempt seconds in between.
+
+        Returns the refused recipients, raises the last error once MAX_ATTEMPTS is spent.
+
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                self._ensure_connected()
+                return self._mail_and_rcpt(sender, recipients, size)
+            except _TRANSIENT_SMTP_ERRORS as e:
+                logger.warning(
+                    "Transient SMTP failure, attempt %d/%d. %s: %s",
+                    attempt + 1, self.MAX_ATTEMPTS, type(e).__name__, e,
+                )
+                # Drop the broken connection, the next attempt reconnects
+                self.close()
+                if attempt + 1 == self.MAX_ATTEMPTS:
+                    raise
+                time.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+
+    def _mail_and_rcpt(self, sender: str, recipients: list[str], size: int) -> dict[str, tuple[int, bytes]]:
+        """ MAIL FROM and one RCPT TO per recipient, mirroring smtplib.SMTP.sendmail() """
+        smtp = self._smtp
+        smtp.ehlo_or_helo_if_needed()
+        mail_options = [f"SIZE={size}"] if smtp.has_extn("size") else []
+
+        code, resp = smtp.mail(sender, mail_options)
+        if code != 250:
+            smtp.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, sender)
+
+        refused: dict[str, tuple[int, bytes]] = {}
+        for recipient in recipients:
+            code, resp = smtp.rcpt(recipient)
+            if code not in (250, 251):
+                refused[recipient] = (code, resp)
+
+        if len(refused) == len(recipients):
+            smtp.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        return refused
+
+    def send_emails(self, messages: list[EmailMessage]) -> list[bool]:
+        """
+        Send a batch of emails over the shared connection, rotating it every
+        MAX_PER_CONNECTION messages. Each MIME message is built fresh.
+        Stops early once more than MAX_BATCH_FAILURE_RATIO of the batch hit
+        connection or auth failures. Per-message refusals never abort the batch.
+
+        Returns the send_email() result for each message, in order.
+
+        """
+        results: list[bool] = []
+        connection_failures = 0
+        for email_contents in messages:
+            sent = self.send_email(email_contents)
+            results.append(sent)
+            if sent or not self._connection_failed:
+                continue
+
+            # Abort once the server looks unreachable for a share of the batch, it is unlikely to recover
+            connection_failures += 1
+            if (len(results) >= self.MIN_BATCH_ATTEMPTS
+                    and connection_failures > len(messages) * self.MAX_BATCH_FAILURE_RATIO):
+                logger.error(
+                    "Aborting email batch after %d/%d connection failures", connection_failures, len(messages))
+                results.extend([False] * (len(messages) - len(results)))
+                break
+        return results
+
+    def prepare_broadcast(self, email_contents: EmailMessage) -> bytes:
+        """
+        Build and serialize the MIME message once, without a To: header,
+        so the same bytes can be reused for every recipient of a broadcast.
+
+        :param email_contents: The EmailMessage dataclass, destination is ignored
+        """
+        email = self._build_email_message(email_contents)
+        del email[MIMESemantics.TO]
+        return email.as_bytes()
+
+    def broadcast(self, recipients: list[str], email_contents: EmailMessage) -> list[bool]:
+        """
+        Send the same email to each recipient as its own message. Attachments
+        are encoded once; only the To: header is generated per recipient.
+
+        Returns the send result for each recipient, in order.
+
+        """
+        if not email_contents:
+            raise SMTPEmailException("Must Specify Message Contents for Mail Transfer")
+
+        payload = self.prepare_broadcast(email_contents)
+        sender = self._cfg.sender_email_address
+        results: list[bool] = []
+        for recipient in recipients:
+            try:
+                to_header = self._to_header(recipient)
+            except (SMTPEmailException, ValueError, UnicodeError) as e:
+                logger.error("Skipping broadcast recipient %r: %s", recipient, e)
+                results.append(False)
+                continue
+            results.append(self._deliver(sender, [recipient], to_header + payload))
+        return results
+
+    @staticmethod
+    def _to_header(recipient: str) -> bytes:
+        """
+        Render the To: header for one broadcast recipient. The header is built
+        through the SMTP policy so non-ASCII display names are RFC 2047 encoded.
+        The policy does not reject line breaks, so check for header injection first.
+        """
+        if "\r" in recipient or "\n" in recipient:
+            raise SMTPEmailException("Recipient address must not contain line breaks")
+        return SMTP.header_factory(MIMESemantics.TO, recipient).fold(policy=SMTP).encode("ascii")
+
+    def _connect(self) -> None:
+        """
+        Open the TLS connection to the SMTP Server and authenticate once.
+        STARTTLS: connect in plain text, EHLO, upgrade, then EHLO again
+        since the server capabilities may change after the upgrade.
+        """
+        try:
+            if self._cfg.security_contract is SMTPTransport.SMTPS_465:
+                self._smtp = smtplib.SMTP_SSL(
+                    self._cfg.smtp_server,
+                    self._cfg.smtp_port,
+                    context=self._SSL_CONTEXT)
+                self._tune_socket(self._smtp.sock)
+            else:
+                self._smtp = smtplib.SMTP(self._cfg.smtp_server, self._cfg.smtp_port)
+                self._tune_socket(self._smtp.sock)
+                self._smtp.ehlo()
+                self._smtp.starttls(context=self._SSL_CONTEXT)
+                self._smtp.ehlo()
+            self._smtp.login(self._cfg.sender_email_address, self._cfg.google_smtp_app_passwd)
+        except Exception:
+            # Never keep a half-open (e.g. unauthenticated) connection around
+            self.close()
+            raise
+        self._sent_on_connection = 0
+        self._last_used = time.monotonic()
+
+    @staticmethod
+    def _tune_socket(sock: socket.socket) -> None:
+        """
+        Disable Nagle so the short command/reply exchanges (EHLO, MAIL FROM,
+        RCPT TO) are not held back, and enlarge the send buffer for DATA.
+        """
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_SEND_BUFFER)
+
+    def _reconnect(self) -> None:
+        """ Drop the current connection (if any) and open a fresh one. """
+        self.close()
+        self._connect()
+
+    def _ensure_connected(self) -> None:
+        """
+        Reuse the open connection while it is under the per-connection message
+        cap. A NOOP round-trip is only spent after IDLE_CHECK_AFTER seconds idle.
+        """
+        if self._smtp is None or self._sent_on_connection >= self.MAX_PER_CONNECTION:
+            self._reconnect()
+        elif time.monotonic() - self._last_used > self.IDLE_CHECK_AFTER and not self.test_connection():
+            self._reconnect()
+
     def test_connection(self) -> bool:
-        """ Python documentation has the .noop() to test connectivity?"""
-        pass
+        """ Health-check the open connection with a NOOP. False if not connected. """
+        if self._smtp is None:
+            return False
+        try:
+            status, _ = self._smtp.noop()
+        except OSError:  # SMTPServerDisconnected, or the socket itself failed
+            return False
+        return status == 250
+
+    def close(self) -> None:
+        """ QUIT the open connection. Safe to call when already closed. """
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except OSError:  # Already dropped by the server, just release the socket
+            self._smtp.close()
+        finally:
+            self._smtp = None
 
 
 class EmailClient:
@@ -206,14 +598,136 @@ class EmailClient:
     Composition with EmailMessage, SMTPClient class 
 
     """
-    def __init__(self) -> None:
-        self._client: SMTPClient = SMTPClient()
+    # SMTP is sequential per connection; parallel sends need one connection per worker.
+    # Keep at or below the provider's concurrent-connection limit.
+    MAX_WORKERS: int = 5
+
+    def __init__(self, security_contract: SMTPTransport = SECURITY_CONTRACT) -> None:
+        self._security_contract: SMTPTransport = security_contract
+        self._client: SMTPClient = SMTPClient(security_contract)
+
+    def __enter__(self) -> "EmailClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._client.close()
 
     def send_email(self, email_message: EmailMessage) -> bool:
         """ Title """
         return True if self._client.send_email(email_message) else False
-    
 
+    def send_emails(self, email_messages: list[EmailMessage]) -> list[bool]:
+        """ Send a batch of emails over a single (rotating) connection """
+        return self._client.send_emails(email_messages)
+
+    def broadcast(self, recipients: list[str], email_message: EmailMessage) -> list[bool]:
+        """ Send one email to many recipients, encoding the body only once """
+        return self._client.broadcast(recipients, email_message)
+
+    def send_many(self, email_messages: list[EmailMessage], max_workers: int = MAX_WORKERS) -> list[bool]:
+        """
+        Send independent emails in parallel from a thread pool. Each worker
+        thread owns its own SMTPClient connection, closed once the pool drains.
+
+        Returns the send result for each message, in order.
+
+        """
+        local = threading.local()
+        clients: list[SMTPClient] = []
+        clients_lock = threading.Lock()
+
+        def _worker_send(email_message: EmailMessage) -> bool:
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = SMTPClient(self._security_contract)
+                with clients_lock:
+                    clients.append(client)
+            return client.send_email(email_message)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_worker_send, email_messages))
+        finally:
+            for client in clients:
+                client.close()
+
+
+class QueuedEmailClient:
+    """
+    Fire-and-forget Email sender. send_email() only enqueues the message,
+    a background daemon thread drains the queue over one persistent
+    SMTPClient connection, so callers never wait on the SMTP round-trip.
+    close() runs at interpreter exit, so mail still queued is sent rather
+    than dropped with the daemon thread.
+
+    Single process only, a multi-process deployment needs a shared broker queue.
+
+    """
+    # Close the idle connection after this many seconds without mail
+    IDLE_TIMEOUT: float = 5.0
+
+    _STOP = object()
+
+    def __init__(self, security_contract: SMTPTransport = SECURITY_CONTRACT) -> None:
+        self._client: SMTPClient = SMTPClient(security_contract)
+        self._queue: queue.Queue = queue.Queue()
+        self._closed: bool = False
+        self._closed_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._drain, name="email-queue", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> "QueuedEmailClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def send_email(self, email_message: EmailMessage) -> None:
+        """
+        Queue the email for the background worker and return immediately.
+
+        Raises SMTPEmailException once the client has been closed.
+
+        """
+        with self._closed_lock:
+            if self._closed:
+                raise SMTPEmailException("QueuedEmailClient is closed, email would never be sent")
+            self._queue.put(email_message)
+
+    def flush(self) -> None:
+        """ Block until every queued email has been processed """
+        self._queue.join()
+
+    def close(self) -> None:
+        """ Send everything still queued, then stop the worker and QUIT. Safe to call twice. """
+        with self._closed_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(self._STOP)
+        atexit.unregister(self.close)
+        self._worker.join()
+
+    def _drain(self) -> None:
+        """ Worker loop, sends queued emails in order over the shared connection """
+        while True:
+            try:
+                item = self._queue.get(timeout=self.IDLE_TIMEOUT)
+            except queue.Empty:
+                self._client.close()
+                continue
+
+            try:
+                if item is self._STOP:
+                    self._client.close()
+                    return
+                self._client.send_email(item)
+            except Exception:
+                # Keep the worker alive on a bad message
+                logger.exception("Exception raised in QueuedEmailClient worker.")
+            finally:
+                self._queue.task_done()
 
 
 if __name__ == "__main__":
@@ -226,4 +740,3 @@ if __name__ == "__main__":
     #   - One email to many
     #
     pass
-